@@ -308,10 +308,14 @@ class MIDIConnectionManager:
         
         return results
     
-    def query_parameter_sync(self, parameter_id: int) -> Optional[int]:
+    def query_parameter_sync(self, parameter_id: int, timeout: Optional[float] = None) -> Optional[int]:
         """
         Synchronous parameter query with response caching
+        Waits up to timeout seconds (default query_timeout) for the response
         """
+        if timeout is None:
+            timeout = self.query_timeout
+            
         # Create a temporary response handler
         response_received = threading.Event()
         response_value = [None]  # Use list for mutable reference
@@ -335,7 +339,7 @@ class MIDIConnectionManager:
                 return None
             
             # Wait for response
-            if response_received.wait(timeout=self.query_timeout):
+            if response_received.wait(timeout=timeout):
                 logger.debug(f"Query successful: param {parameter_id} = {response_value[0]}")
                 return response_value[0]
             else:
@@ -346,14 +350,14 @@ class MIDIConnectionManager:
             # Restore original callback
             self.parameter_callback = old_callback
     
-    def test_connection(self) -> bool:
+    def test_connection(self, timeout: Optional[float] = None) -> bool:
         """Test connection by querying a simple parameter"""
         if not self.is_connected:
             return False
         
         # Try to query Unit ID (parameter 0) as a connection test
         try:
-            result = self.query_parameter_sync(0)  # Unit ID parameter
+            result = self.query_parameter_sync(0, timeout)  # Unit ID parameter
             return result is not None
         except Exception as e:
             logger.error(f"Connection test failed: {e}")
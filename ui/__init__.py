@@ -13,7 +13,8 @@ from .parameter_widgets import (
     MIDIChannelParameterWidget,
     ParameterWidgetFactory,
     ParameterGroupWidget,
-    DependencyManager
+    DependencyManager,
+    create_parameter_widget
 )
 from .midi_settings_dialog import MIDISettingsDialog
 from .midi_log_window import MIDILogWindow
@@ -28,6 +29,7 @@ __all__ = [
     'ParameterWidgetFactory',
     'ParameterGroupWidget',
     'DependencyManager',
+    'create_parameter_widget',
     'MIDISettingsDialog',
     'MIDILogWindow'
 ]
\ No newline at end of file
@@ -19,7 +19,7 @@ from data.parameter_definitions import (
     ParameterCategory, get_parameters_by_category, get_parameter_by_id,
     get_all_parameter_defaults, Parameter
 )
-from ui.parameter_widgets import ParameterWidget, ParameterWidgetFactory
+from ui.parameter_widgets import ParameterWidget, create_parameter_widget
 from ui.midi_settings_dialog import MIDISettingsDialog
 from ui.midi_log_window import MIDILogWindow
 
@@ -191,7 +191,6 @@ class MatriarchMainWindow(QMainWindow):
     def create_parameter_tabs(self):
         """Create tabs for each parameter category"""
         categories = get_parameters_by_category()
-        widget_factory = ParameterWidgetFactory()
         
         for category, parameters in categories.items():
             # Create tab
@@ -217,7 +216,7 @@ class MatriarchMainWindow(QMainWindow):
             
             for param in parameters:
                 # Create parameter widget
-                param_widget = widget_factory.create_widget(param)
+                param_widget = create_parameter_widget(param)
                 param_widget.value_changed.connect(self.on_parameter_changed)
                 self.parameter_widgets[param.param_id] = param_widget
                 
@@ -2,28 +2,80 @@
 MIDI Log Window for monitoring MIDI communication
 """
 
+import html
 import logging
 import os
-from datetime import datetime
-from typing import List, Dict, Any
+import time
+from collections import deque
+from itertools import compress
+from datetime import datetime, timedelta
+from typing import List, Deque, Iterable
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, QPushButton,
     QCheckBox, QGroupBox, QLabel, QFileDialog, QMessageBox,
     QComboBox, QSpinBox
 )
-from PyQt5.QtCore import Qt, QTimer, QSettings
+from PyQt5.QtCore import Qt, QTimer, QSettings, pyqtSignal, pyqtSlot
 from PyQt5.QtGui import QFont, QTextCursor, QColor
 
 logger = logging.getLogger(__name__)
 
+# Log entry flag bits: one direction bit and one type bit per message
+FLAG_IN = 0x01
+FLAG_OUT = 0x02
+FLAG_SYSEX = 0x04
+FLAG_CC = 0x08
+FLAG_OTHER = 0x10
+
+TYPE_BITS = {
+    'SYSEX': FLAG_SYSEX,
+    'CC': FLAG_CC,
+    'OTHER': FLAG_OTHER
+}
+
+# Length of the "IN:  " / "OUT: " prefix MIDIConnectionManager puts on log messages
+LOG_PREFIX_LEN = 5
+
+# Display refresh intervals, chosen per tick from the message arrival rate
+REFRESH_BURST_MS = 30
+REFRESH_NORMAL_MS = 100
+REFRESH_IDLE_MS = 500
+BURST_MESSAGES_PER_SEC = 500
+IDLE_TICKS_BEFORE_SLOWDOWN = 3
+
+class LogEntry:
+    """A single logged MIDI message"""
+    
+    __slots__ = ('offset_ns', 'message', 'html_message', 'is_incoming', 'dir_str', 'type', 'flags')
+    
+    def __init__(self, offset_ns: int, message: str, is_incoming: bool, msg_type: str):
+        self.offset_ns = offset_ns  # Nanoseconds since the log window's session epoch
+        self.message = message
+        self.html_message = html.escape(message)  # Escaped once for HTML display
+        self.is_incoming = is_incoming
+        self.dir_str = "IN " if is_incoming else "OUT"
+        self.type = msg_type
+        self.flags = (FLAG_IN if is_incoming else FLAG_OUT) | TYPE_BITS[msg_type]
+
 class MIDILogWindow(QWidget):
     """Window for displaying and filtering MIDI log messages"""
     
+    # Carries entries built on MIDI/worker threads over to the GUI thread
+    entry_logged = pyqtSignal(object)
+    
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.entry_logged.connect(self._append_entry)
         self.settings = QSettings()
-        self.log_messages: List[Dict[str, Any]] = []
         self.max_messages = 1000  # Limit memory usage
+        self.log_messages: Deque[LogEntry] = deque(maxlen=self.max_messages)
+        # Flags column kept in step with log_messages for tight filter passes
+        self._flags: Deque[int] = deque(maxlen=self.max_messages)
+        
+        # Filtered view, maintained incrementally as messages arrive
+        self._filtered: Deque[LogEntry] = deque(maxlen=self.max_messages)
+        self._unrendered: List[LogEntry] = []
+        self._needs_full_render = False
         
         # UI components
         self.log_display: QTextEdit = None
@@ -42,14 +94,25 @@ class MIDILogWindow(QWidget):
             'show_cc': True,
             'auto_scroll': True
         }
+        self.filter_mask = FLAG_IN | FLAG_OUT | FLAG_SYSEX | FLAG_CC | FLAG_OTHER
+        self._save_pending = False
+        self._arrivals_since_tick = 0
+        self._idle_ticks = 0
+        self._count_dirty = False
+        self._showing_status = False
+        
+        # Session epoch: messages store a monotonic offset, converted to wall time lazily
+        self._epoch_wall = datetime.now()
+        self._epoch_mono = time.perf_counter_ns()
         
         self.init_ui()
         self.load_settings()
         
         # Auto-refresh timer
         self.refresh_timer = QTimer()
-        self.refresh_timer.timeout.connect(self.refresh_display)
-        self.refresh_timer.start(100)  # Refresh every 100ms
+        self.refresh_timer.setTimerType(Qt.CoarseTimer)  # Don't raise the OS timer resolution
+        self.refresh_timer.timeout.connect(self.on_refresh_tick)
+        self.refresh_timer.start(REFRESH_NORMAL_MS)  # Adapted to message rate on each tick
     
     def init_ui(self):
         """Initialize the user interface"""
@@ -65,24 +128,24 @@ class MIDILogWindow(QWidget):
         # Message type filters
         self.show_incoming_check = QCheckBox("Incoming")
         self.show_incoming_check.setChecked(True)
-        self.show_incoming_check.toggled.connect(self.on_filter_changed)
+        self.show_incoming_check.toggled.connect(lambda checked, key='show_incoming': self._set_filter(key, checked))
         filter_layout.addWidget(self.show_incoming_check)
         
         self.show_outgoing_check = QCheckBox("Outgoing")
         self.show_outgoing_check.setChecked(True)
-        self.show_outgoing_check.toggled.connect(self.on_filter_changed)
+        self.show_outgoing_check.toggled.connect(lambda checked, key='show_outgoing': self._set_filter(key, checked))
         filter_layout.addWidget(self.show_outgoing_check)
         
         filter_layout.addWidget(QLabel("|"))
         
         self.show_sysex_check = QCheckBox("SysEx")
         self.show_sysex_check.setChecked(True)
-        self.show_sysex_check.toggled.connect(self.on_filter_changed)
+        self.show_sysex_check.toggled.connect(lambda checked, key='show_sysex': self._set_filter(key, checked))
         filter_layout.addWidget(self.show_sysex_check)
         
         self.show_cc_check = QCheckBox("Control Change")
         self.show_cc_check.setChecked(True)
-        self.show_cc_check.toggled.connect(self.on_filter_changed)
+        self.show_cc_check.toggled.connect(lambda checked, key='show_cc': self._set_filter(key, checked))
         filter_layout.addWidget(self.show_cc_check)
         
         filter_layout.addWidget(QLabel("|"))
@@ -90,7 +153,7 @@ class MIDILogWindow(QWidget):
         # Auto-scroll option
         self.auto_scroll_check = QCheckBox("Auto-scroll")
         self.auto_scroll_check.setChecked(True)
-        self.auto_scroll_check.toggled.connect(self.on_filter_changed)
+        self.auto_scroll_check.toggled.connect(lambda checked, key='auto_scroll': self._set_filter(key, checked))
         filter_layout.addWidget(self.auto_scroll_check)
         
         filter_layout.addStretch()
@@ -105,6 +168,7 @@ class MIDILogWindow(QWidget):
         self.log_display = QTextEdit()
         self.log_display.setReadOnly(True)
         self.log_display.setFont(QFont("Consolas", 9))  # Monospace font
+        self.log_display.document().setMaximumBlockCount(self.max_messages)
         layout.addWidget(self.log_display)
         
         # Control buttons
@@ -208,119 +272,167 @@ class MIDILogWindow(QWidget):
         """)
     
     def add_message(self, message: str, is_incoming: bool):
-        """Add a MIDI message to the log"""
-        timestamp = datetime.now()
+        """Add a MIDI message to the log; safe to call from any thread"""
+        offset_ns = time.perf_counter_ns() - self._epoch_mono
         
-        # Parse message type
-        msg_type = "OTHER"
-        if "SysEx:" in message:
+        # Parse message type from just past the direction prefix, so long
+        # SysEx dumps are never scanned in full
+        if message.startswith("SysEx:", LOG_PREFIX_LEN):
             msg_type = "SYSEX"
-        elif "control_change" in message.lower():
+        elif message.startswith("control_change", LOG_PREFIX_LEN):
             msg_type = "CC"
+        else:
+            msg_type = "OTHER"
         
-        log_entry = {
-            'timestamp': timestamp,
-            'message': message,
-            'is_incoming': is_incoming,
-            'type': msg_type
-        }
+        # Buffers are only touched on the GUI thread, so iterating them in
+        # filter/render/save can't race with arriving messages
+        self.entry_logged.emit(LogEntry(offset_ns, message, is_incoming, msg_type))
+    
+    @pyqtSlot(object)
+    def _append_entry(self, log_entry: LogEntry):
+        """Append an entry to the log buffers (GUI thread)"""
+        flags = log_entry.flags
         
+        # Deques are bounded by max_messages, so old entries drop off automatically
         self.log_messages.append(log_entry)
+        self._arrivals_since_tick += 1
+        self._flags.append(flags)
+        if (flags & self.filter_mask) == flags:
+            self._filtered.append(log_entry)
+            if not self._needs_full_render:
+                self._unrendered.append(log_entry)
+                if len(self._unrendered) > self.max_messages:
+                    # More backlog than the display keeps (e.g. while hidden):
+                    # redraw from the bounded filtered view instead
+                    self._unrendered = []
+                    self._needs_full_render = True
+        
+        # Count label is updated by the next refresh
+        self._count_dirty = True
+    
+    def on_refresh_tick(self):
+        """Refresh the display and retune the refresh interval to the message rate"""
+        arrivals = self._arrivals_since_tick
+        self._arrivals_since_tick = 0
+        
+        # Rate rather than raw count, so the threshold doesn't depend on the current interval
+        rate = arrivals * 1000 / self.refresh_timer.interval()
+        
+        if rate > BURST_MESSAGES_PER_SEC:
+            self._idle_ticks = 0
+            interval = REFRESH_BURST_MS
+        elif arrivals == 0:
+            self._idle_ticks += 1
+            if self._idle_ticks >= IDLE_TICKS_BEFORE_SLOWDOWN:
+                interval = REFRESH_IDLE_MS
+            else:
+                interval = self.refresh_timer.interval()
+        else:
+            self._idle_ticks = 0
+            interval = REFRESH_NORMAL_MS
+        
+        if interval != self.refresh_timer.interval():
+            self.refresh_timer.setInterval(interval)
         
-        # Limit memory usage
-        if len(self.log_messages) > self.max_messages:
-            self.log_messages = self.log_messages[-self.max_messages:]
-        
-        # Update count immediately
-        self.update_message_count()
+        self.refresh_display()
     
     def refresh_display(self):
-        """Refresh the log display based on current filters"""
-        if not self.log_messages:
-            return
-        
+        """Render newly arrived messages, or everything after a filter change"""
+        if self._needs_full_render:
+            self._needs_full_render = False
+            self._unrendered = []
+            self.log_display.clear()
+            self.render_messages(self._filtered)
+        elif self._unrendered:
+            pending = self._unrendered
+            self._unrendered = []
+            self.render_messages(pending)
+        
+        if self._count_dirty and not self._showing_status:
+            self._count_dirty = False
+            self.update_message_count()
+    
+    def render_messages(self, messages: Iterable[LogEntry]):
+        """Append messages to the end of the log display"""
         # Get current scroll position
         scrollbar = self.log_display.verticalScrollBar()
         was_at_bottom = scrollbar.value() >= scrollbar.maximum() - 10
         
-        # Filter messages
-        filtered_messages = []
-        for msg in self.log_messages:
-            if not self.should_show_message(msg):
-                continue
-            filtered_messages.append(msg)
-        
-        # Only update if we have new content or filters changed
-        current_text = self.log_display.toPlainText()
-        new_text = self.format_messages(filtered_messages)
+        # Add messages with color formatting
+        cursor = self.log_display.textCursor()
+        cursor.movePosition(QTextCursor.End)
         
-        if current_text != new_text:
-            self.log_display.clear()
-            
-            # Add messages with color formatting
-            cursor = self.log_display.textCursor()
-            cursor.movePosition(QTextCursor.End)
+        for msg in messages:
+            # Format timestamp
+            time_str = self.entry_time(msg).strftime("%H:%M:%S.%f")[:-3]  # Include milliseconds
             
-            for msg in filtered_messages:
-                # Format timestamp
-                time_str = msg['timestamp'].strftime("%H:%M:%S.%f")[:-3]  # Include milliseconds
-                
-                # Choose color based on direction and type
-                if msg['is_incoming']:
-                    if msg['type'] == 'SYSEX':
-                        color = "#66ff66"  # Bright green for incoming SysEx
-                    else:
-                        color = "#99ff99"  # Light green for other incoming
+            # Choose color based on direction and type
+            if msg.is_incoming:
+                if msg.type == 'SYSEX':
+                    color = "#66ff66"  # Bright green for incoming SysEx
                 else:
-                    if msg['type'] == 'SYSEX':
-                        color = "#66ccff"  # Bright blue for outgoing SysEx
-                    else:
-                        color = "#99ccff"  # Light blue for other outgoing
-                
-                # Format and insert message
-                formatted_msg = f"[{time_str}] {msg['message']}\n"
-                
-                cursor.insertHtml(f'<span style="color: {color};">{formatted_msg}</span>')
+                    color = "#99ff99"  # Light green for other incoming
+            else:
+                if msg.type == 'SYSEX':
+                    color = "#66ccff"  # Bright blue for outgoing SysEx
+                else:
+                    color = "#99ccff"  # Light blue for other outgoing
+            
+            # One block per message so the document's block limit trims old lines
+            if not cursor.atStart():
+                cursor.insertBlock()
+            
+            # Format and insert message
+            formatted_msg = f"[{time_str}] {msg.html_message}"
             
-            # Auto-scroll if enabled and was at bottom
-            if self.filter_settings['auto_scroll'] and was_at_bottom:
-                scrollbar.setValue(scrollbar.maximum())
+            cursor.insertHtml(f'<span style="color: {color};">{formatted_msg}</span>')
+        
+        # Auto-scroll if enabled and was at bottom
+        if self.filter_settings['auto_scroll'] and was_at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
     
-    def should_show_message(self, msg: Dict[str, Any]) -> bool:
-        """Check if message should be shown based on current filters"""
-        # Direction filter
-        if msg['is_incoming'] and not self.filter_settings['show_incoming']:
-            return False
-        if not msg['is_incoming'] and not self.filter_settings['show_outgoing']:
-            return False
-        
-        # Type filter
-        if msg['type'] == 'SYSEX' and not self.filter_settings['show_sysex']:
-            return False
-        if msg['type'] == 'CC' and not self.filter_settings['show_cc']:
-            return False
-        
-        return True
+    def entry_time(self, msg: LogEntry) -> datetime:
+        """Get the wall-clock time a message was logged"""
+        return self._epoch_wall + timedelta(microseconds=msg.offset_ns // 1000)
     
-    def format_messages(self, messages: List[Dict[str, Any]]) -> str:
-        """Format messages for plain text display"""
-        formatted = []
-        for msg in messages:
-            time_str = msg['timestamp'].strftime("%H:%M:%S.%f")[:-3]
-            formatted.append(f"[{time_str}] {msg['message']}")
-        return '\n'.join(formatted)
+    def update_filter_mask(self):
+        """Rebuild the filter bitmask from the current filter settings"""
+        mask = FLAG_OTHER  # Unclassified messages are always shown
+        if self.filter_settings['show_incoming']:
+            mask |= FLAG_IN
+        if self.filter_settings['show_outgoing']:
+            mask |= FLAG_OUT
+        if self.filter_settings['show_sysex']:
+            mask |= FLAG_SYSEX
+        if self.filter_settings['show_cc']:
+            mask |= FLAG_CC
+        self.filter_mask = mask
     
-    def on_filter_changed(self):
-        """Handle filter checkbox changes"""
-        self.filter_settings['show_incoming'] = self.show_incoming_check.isChecked()
-        self.filter_settings['show_outgoing'] = self.show_outgoing_check.isChecked()
-        self.filter_settings['show_sysex'] = self.show_sysex_check.isChecked()
-        self.filter_settings['show_cc'] = self.show_cc_check.isChecked()
-        self.filter_settings['auto_scroll'] = self.auto_scroll_check.isChecked()
-        
-        # Force immediate refresh
-        self.refresh_display()
-        self.save_settings()
+    def rebuild_filtered(self):
+        """Rebuild the filtered view from the full history"""
+        mask = self.filter_mask
+        self._filtered = deque(
+            compress(self.log_messages, [(flags & mask) == flags for flags in self._flags]),
+            maxlen=self.max_messages
+        )
+        self._unrendered = []
+        self._needs_full_render = True
+    
+    def _set_filter(self, key: str, value: bool):
+        """Handle a single filter checkbox change"""
+        if self.filter_settings[key] == value:
+            return
+        self.filter_settings[key] = value
+        
+        # Auto-scroll doesn't affect which messages are shown
+        if key != 'auto_scroll':
+            self.update_filter_mask()
+            self.rebuild_filtered()
+            
+            # Force immediate refresh
+            self.refresh_display()
+        
+        self._schedule_save()
     
     def clear_log(self):
         """Clear all log messages"""
@@ -333,6 +445,9 @@ class MIDILogWindow(QWidget):
         
         if reply == QMessageBox.Yes:
             self.log_messages.clear()
+            self._flags.clear()
+            self._filtered.clear()
+            self._unrendered = []
             self.log_display.clear()
             self.update_message_count()
     
@@ -355,18 +470,23 @@ class MIDILogWindow(QWidget):
             return
         
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
+            with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
                 f.write(f"Matriarch Controller MIDI Log\n")
                 f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
                 f.write(f"Total Messages: {len(self.log_messages)}\n")
                 f.write("=" * 80 + "\n\n")
                 
-                for msg in self.log_messages:
-                    timestamp = msg['timestamp'].strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-                    direction = "IN " if msg['is_incoming'] else "OUT"
-                    f.write(f"[{timestamp}] {direction}: {msg['message']}\n")
+                # Stream all lines through one writelines call
+                f.writelines(
+                    "".join((
+                        "[", self.entry_time(msg).strftime('%Y-%m-%d %H:%M:%S.%f')[:-3], "] ",
+                        msg.dir_str, ": ", msg.message, "\n"
+                    ))
+                    for msg in self.log_messages
+                )
             
-            QMessageBox.information(self, "Log Saved", f"Log saved to:\n{filename}")
+            # Transient status instead of a modal box, so logging keeps flowing
+            self.show_status(f"Saved \u2192 {os.path.basename(filename)}")
             
         except Exception as e:
             logger.error(f"Error saving log file: {e}")
@@ -376,11 +496,28 @@ class MIDILogWindow(QWidget):
         """Set maximum number of messages to keep in memory"""
         self.max_messages = value
         
-        # Trim current messages if needed
-        if len(self.log_messages) > self.max_messages:
-            self.log_messages = self.log_messages[-self.max_messages:]
-            self.refresh_display()
-        
+        # Re-bound the buffers, trimming current messages if needed
+        self.resize_buffers()
+        self._count_dirty = True
+        self.refresh_display()
+    
+    def resize_buffers(self):
+        """Re-bound the message buffers and display to max_messages"""
+        self.log_messages = deque(self.log_messages, maxlen=self.max_messages)
+        self._flags = deque(self._flags, maxlen=self.max_messages)
+        self.log_display.document().setMaximumBlockCount(self.max_messages)
+        self.rebuild_filtered()
+    
+    def show_status(self, text: str, duration_ms: int = 3000):
+        """Show a transient status in place of the message count"""
+        self._showing_status = True
+        self.message_count_label.setText(text)
+        QTimer.singleShot(duration_ms, self.clear_status)
+    
+    def clear_status(self):
+        """Revert the transient status back to the message count"""
+        self._showing_status = False
+        self._count_dirty = False
         self.update_message_count()
     
     def update_message_count(self):
@@ -402,6 +539,8 @@ class MIDILogWindow(QWidget):
         self.filter_settings['show_cc'] = self.settings.value('midi_log/show_cc', True, type=bool)
         self.filter_settings['auto_scroll'] = self.settings.value('midi_log/auto_scroll', True, type=bool)
         self.max_messages = self.settings.value('midi_log/max_messages', 1000, type=int)
+        self.update_filter_mask()
+        self.resize_buffers()
         
         # Update checkboxes
         self.show_incoming_check.setChecked(self.filter_settings['show_incoming'])
@@ -423,6 +562,25 @@ class MIDILogWindow(QWidget):
         self.settings.setValue('midi_log/auto_scroll', self.filter_settings['auto_scroll'])
         self.settings.setValue('midi_log/max_messages', self.max_messages)
     
+    def _schedule_save(self):
+        """Coalesce rapid settings changes into a single deferred save"""
+        if self._save_pending:
+            return
+        self._save_pending = True
+        QTimer.singleShot(500, Qt.CoarseTimer, self._do_save)
+    
+    def _do_save(self):
+        """Write settings scheduled by _schedule_save"""
+        self._save_pending = False
+        self.save_settings()
+    
+    def showEvent(self, event):
+        """Resume refreshing when the window is shown again after a close"""
+        super().showEvent(event)
+        if not self.refresh_timer.isActive():
+            self.refresh_timer.start()
+            self.refresh_display()
+    
     def closeEvent(self, event):
         """Handle window close event"""
         self.save_settings()
@@ -3,42 +3,302 @@ MIDI Settings Dialog for port selection and configuration
 """
 
 import logging
+import time
 from typing import Dict, List, Optional
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QLabel, 
     QComboBox, QSpinBox, QPushButton, QGroupBox, QMessageBox,
     QDialogButtonBox, QProgressBar, QTextEdit, QCheckBox
 )
-from PyQt5.QtCore import Qt, QSettings, QTimer, pyqtSignal
-from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt, QSettings, QTimer, QThread, pyqtSignal
+from PyQt5.QtGui import QFont, QColor, QTextCharFormat, QTextCursor
 
 from midi.connection import MIDIConnectionManager
 
 logger = logging.getLogger(__name__)
 
+# Parameters queried by the connection test
+_TEST_PARAM_IDS = (0, 10, 37)  # Unit ID, MIDI Channel, Pitch Bend Range
+
+# Test result text colors by kind
+_LOG_COLORS = {
+    'info': '#ffffff',
+    'ok': '#00ff00',
+    'warn': '#ffaa00',
+    'err': '#ff6666'
+}
+
+# Slack on top of the per-query timeouts before the connection test is aborted
+_TEST_WATCHDOG_MARGIN_MS = 1000
+# Longest the dialog blocks on close waiting for a test to restore the connection
+_TEST_CLOSE_WAIT_MS = 2000
+
+# How long a port scan result is reused before enumerating again
+_PORTS_CACHE_TTL = 2.0  # seconds
+
+# Stylesheets are built once at import and shared by every dialog instance
+_DARK_QSS = """
+    QDialog {
+        background-color: #2b2b2b;
+        color: #ffffff;
+    }
+    QGroupBox {
+        font-weight: bold;
+        border: 2px solid #666666;
+        border-radius: 5px;
+        margin: 5px 0px;
+        padding-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+        color: #ff6b35;
+    }
+    QLabel {
+        color: #ffffff;
+    }
+    QLabel[status="idle"] {
+        color: #888888;
+    }
+    QLabel[status="warn"] {
+        color: #ffaa00;
+    }
+    QLabel[status="ok"] {
+        color: #00ff00;
+    }
+    QLabel[status="err"] {
+        color: #ff6666;
+    }
+    QComboBox {
+        background-color: #4a4a4a;
+        border: 1px solid #666666;
+        padding: 4px;
+        border-radius: 3px;
+        color: #ffffff;
+        min-height: 20px;
+    }
+    QComboBox::drop-down {
+        border: none;
+        width: 20px;
+    }
+    QComboBox::down-arrow {
+        image: none;
+        border-left: 4px solid transparent;
+        border-right: 4px solid transparent;
+        border-top: 4px solid #ffffff;
+    }
+    QComboBox QAbstractItemView {
+        background-color: #3c3c3c;
+        border: 1px solid #666666;
+        selection-background-color: #ff6b35;
+        color: #ffffff;
+    }
+    QSpinBox {
+        background-color: #4a4a4a;
+        border: 1px solid #666666;
+        padding: 4px;
+        border-radius: 3px;
+        color: #ffffff;
+        min-height: 20px;
+    }
+    QSpinBox::up-button, QSpinBox::down-button {
+        background-color: #5a5a5a;
+        border: 1px solid #666666;
+        width: 16px;
+    }
+    QSpinBox::up-button:hover, QSpinBox::down-button:hover {
+        background-color: #6a6a6a;
+    }
+    QPushButton {
+        background-color: #4a4a4a;
+        color: #ffffff;
+        border: 1px solid #666666;
+        padding: 6px 16px;
+        border-radius: 3px;
+        min-height: 20px;
+    }
+    QPushButton:hover {
+        background-color: #5a5a5a;
+        border-color: #777777;
+    }
+    QPushButton:pressed {
+        background-color: #ff6b35;
+    }
+    QDialogButtonBox QPushButton {
+        min-width: 80px;
+    }
+"""
+
+_TEST_RESULTS_QSS = """
+    QTextEdit {
+        background-color: #2a2a2a;
+        border: 1px solid #555555;
+        font-family: monospace;
+        font-size: 10px;
+        color: #ffffff;
+    }
+"""
+
+class PortScanWorker(QThread):
+    """Worker thread for enumerating MIDI ports without blocking UI"""
+    
+    ports_scanned = pyqtSignal(dict)  # {'inputs': [...], 'outputs': [...]}
+    error_occurred = pyqtSignal(str)  # error message
+    
+    def __init__(self, midi_manager: MIDIConnectionManager):
+        super().__init__()
+        self.midi_manager = midi_manager
+    
+    def run(self):
+        """Enumerate MIDI ports in background thread"""
+        try:
+            self.ports_scanned.emit(self.midi_manager.get_available_ports())
+        except Exception as e:
+            logger.exception("Error in port scan worker")
+            self.error_occurred.emit(str(e))
+
+class ConnectionTestWorker(QThread):
+    """Worker thread for testing the MIDI connection without blocking UI"""
+    
+    lines_logged = pyqtSignal(list, str)  # lines for the test results, kind ('info', 'ok', ...)
+    status_changed = pyqtSignal(str, str)  # status text, status key ('ok', 'err', ...)
+    connection_failed = pyqtSignal()  # ports could not be opened
+    parameter_queried = pyqtSignal(int, object)  # param_id, value / None on timeout / exception
+    
+    def __init__(self, midi_manager: MIDIConnectionManager, input_port: str, output_port: str,
+                 unit_id: int, midi_channel: int, query_delay: float, query_timeout: float):
+        super().__init__()
+        self.midi_manager = midi_manager
+        self.input_port = input_port
+        self.output_port = output_port
+        self.unit_id = unit_id
+        self.midi_channel = midi_channel  # 0-15
+        self.query_delay = query_delay  # seconds between queries
+        self.query_timeout = query_timeout  # seconds to wait for each response
+        self._cancelled = False
+    
+    def cancel(self):
+        """Stop issuing further queries; the connection is still restored"""
+        self._cancelled = True
+    
+    def run(self):
+        """Connect, test communication and query sample parameters in background thread"""
+        try:
+            # Temporarily update MIDI manager settings
+            old_unit_id = self.midi_manager.unit_id
+            old_channel = self.midi_manager.midi_channel
+            old_delay = self.midi_manager.query_delay
+            
+            self.midi_manager.update_settings(self.unit_id, self.midi_channel)
+            self.midi_manager.query_delay = self.query_delay
+            
+            # Test connection
+            was_connected = self.midi_manager.is_connected
+            if was_connected:
+                self.midi_manager.disconnect()
+            
+            if self.midi_manager.connect(self.input_port, self.output_port):
+                # Test communication
+                self.lines_logged.emit(["✓ MIDI connection established"], 'ok')
+                self.lines_logged.emit(["Testing communication..."], 'info')
+                if self.midi_manager.test_connection(timeout=self.query_timeout):
+                    self.status_changed.emit("✓ Connection OK", "ok")
+                    
+                    # Try querying a few parameters, reporting each result as it arrives
+                    self.lines_logged.emit(["✓ Communication test PASSED"], 'ok')
+                    self.lines_logged.emit(["Querying sample parameters..."], 'info')
+                    for param_id in _TEST_PARAM_IDS:
+                        if self._cancelled:
+                            break
+                        try:
+                            value = self.midi_manager.query_parameter_sync(param_id, timeout=self.query_timeout)
+                        except Exception as e:
+                            value = e
+                        self.parameter_queried.emit(param_id, value)
+                    
+                else:
+                    self.status_changed.emit("✗ No Response", "err")
+                    self.lines_logged.emit(["✗ Communication test FAILED"], 'err')
+                    self.lines_logged.emit(["Check:",
+                                            "  - Matriarch is powered on",
+                                            "  - MIDI cables connected properly",
+                                            "  - Matriarch MIDI channel settings"], 'info')
+                
+                # Restore previous connection state
+                self.midi_manager.disconnect()
+                if was_connected:
+                    # Try to reconnect with original settings
+                    self.midi_manager.update_settings(old_unit_id, old_channel)
+                    self.midi_manager.query_delay = old_delay
+                    
+            else:
+                self.connection_failed.emit()
+                self.status_changed.emit("✗ Connection Failed", "err")
+                self.lines_logged.emit(["✗ Failed to establish MIDI connection"], 'err')
+                self.lines_logged.emit(["Check port availability and permissions"], 'info')
+            
+        except Exception as e:
+            logger.exception("Error during connection test")
+            self.lines_logged.emit([f"✗ Test failed: {e}"], 'err')
+            self.status_changed.emit("✗ Test Error", "err")
+
 class MIDISettingsDialog(QDialog):
     """Dialog for MIDI port selection and settings"""
     
+    # UI components, created by init_ui() on first show
+    input_combo: QComboBox
+    output_combo: QComboBox
+    unit_id_spin: QSpinBox
+    midi_channel_spin: QSpinBox
+    query_delay_spin: QSpinBox
+    test_button: QPushButton
+    refresh_button: QPushButton
+    connection_status: QLabel
+    test_results: QTextEdit
+    auto_reconnect_check: QCheckBox
+    auto_query_check: QCheckBox
+    button_box: QDialogButtonBox
+    
     def __init__(self, midi_manager: MIDIConnectionManager, parent=None):
         super().__init__(parent)
         self.midi_manager = midi_manager
         self.settings = QSettings()
         
-        # UI components
-        self.input_combo: Optional[QComboBox] = None
-        self.output_combo: Optional[QComboBox] = None
-        self.unit_id_spin: Optional[QSpinBox] = None
-        self.midi_channel_spin: Optional[QSpinBox] = None
-        self.query_delay_spin: Optional[QSpinBox] = None
-        self.test_button: Optional[QPushButton] = None
-        self.refresh_button: Optional[QPushButton] = None
-        self.connection_status: Optional[QLabel] = None
-        
         self.available_ports = {'inputs': [], 'outputs': []}
-        
-        self.init_ui()
-        self.load_settings()
-        self.refresh_ports()
+        self.scan_worker: Optional[PortScanWorker] = None
+        self.test_worker: Optional[ConnectionTestWorker] = None
+        self._scan_inflight = False
+        self._ports_cache: Optional[Dict[str, List[str]]] = None
+        self._ports_cache_ts = 0.0
+        self._last_port_tuple: Optional[tuple] = None  # Port lists currently shown in the combos
+        
+        # Port name -> combo index, rebuilt whenever the combos are filled
+        self._input_index: Dict[str, int] = {}
+        self._output_index: Dict[str, int] = {}
+        
+        # Saved port selections, applied once the first scan fills the combos
+        self._pending_input_port: Optional[str] = None
+        self._pending_output_port: Optional[str] = None
+        
+        # Last connection test settings and where its header ends in test_results
+        self._last_test_key: Optional[tuple] = None
+        self._test_header_end = 0
+        
+        # Values last read from or written to QSettings, keyed like the 'midi' group
+        self._saved_state: Dict[str, object] = {}
+        
+        # Widgets are built on first show, not at construction
+        self._built = False
+    
+    def showEvent(self, event):
+        """Build the UI and scan ports the first time the dialog is shown"""
+        if not self._built:
+            self._built = True
+            self.init_ui()
+            self.load_settings()
+            self.refresh_ports()
+        super().showEvent(event)
     
     def init_ui(self):
         """Initialize the dialog UI"""
@@ -46,16 +306,21 @@ class MIDISettingsDialog(QDialog):
         self.setModal(True)
         self.resize(500, 400)
         
+        # Collapse the relayouts and repaints from building the widget tree into one pass
+        self.setUpdatesEnabled(False)
+        
         layout = QVBoxLayout(self)
         
         # Port Selection Group
         port_group = QGroupBox("MIDI Ports")
         port_layout = QFormLayout(port_group)
+        port_layout.setEnabled(False)
         
         # Input port selection
         input_layout = QHBoxLayout()
         self.input_combo = QComboBox()
         self.input_combo.setMinimumWidth(250)
+        self.input_combo.view().setUniformItemSizes(True)
         input_layout.addWidget(self.input_combo)
         
         self.refresh_button = QPushButton("Refresh")
@@ -67,13 +332,16 @@ class MIDISettingsDialog(QDialog):
         # Output port selection
         self.output_combo = QComboBox()
         self.output_combo.setMinimumWidth(250)
+        self.output_combo.view().setUniformItemSizes(True)
         port_layout.addRow("Output Port:", self.output_combo)
         
+        port_layout.setEnabled(True)
         layout.addWidget(port_group)
         
         # MIDI Configuration Group
         config_group = QGroupBox("MIDI Configuration")
         config_layout = QFormLayout(config_group)
+        config_layout.setEnabled(False)
         
         # Unit ID
         self.unit_id_spin = QSpinBox()
@@ -118,11 +386,13 @@ class MIDISettingsDialog(QDialog):
         
         config_layout.addRow("Startup:", auto_reconnect_layout)
         
+        config_layout.setEnabled(True)
         layout.addWidget(config_group)
         
         # Connection Test Group
         test_group = QGroupBox("Connection Test")
         test_layout = QVBoxLayout(test_group)
+        test_layout.setEnabled(False)
         
         # Test button and status
         test_button_layout = QHBoxLayout()
@@ -131,7 +401,11 @@ class MIDISettingsDialog(QDialog):
         test_button_layout.addWidget(self.test_button)
         
         self.connection_status = QLabel("Not tested")
-        self.connection_status.setStyleSheet("color: #888888;")
+        self.connection_status.setProperty("status", "idle")  # Colored by _DARK_QSS
+        
+        self._watchdog = QTimer(self)
+        self._watchdog.setSingleShot(True)
+        self._watchdog.timeout.connect(self._abort_test)
         test_button_layout.addWidget(self.connection_status)
         test_button_layout.addStretch()
         
@@ -141,251 +415,265 @@ class MIDISettingsDialog(QDialog):
         self.test_results = QTextEdit()
         self.test_results.setMaximumHeight(100)
         self.test_results.setReadOnly(True)
-        self.test_results.setStyleSheet("""
-            QTextEdit {
-                background-color: #2a2a2a;
-                border: 1px solid #555555;
-                font-family: monospace;
-                font-size: 10px;
-                color: #ffffff;
-            }
-        """)
+        self.test_results.setStyleSheet(_TEST_RESULTS_QSS)
+        
+        # Pre-built text formats for colored result lines
+        self._log_formats: Dict[str, QTextCharFormat] = {}
+        for kind, color in _LOG_COLORS.items():
+            fmt = QTextCharFormat()
+            fmt.setForeground(QColor(color))
+            self._log_formats[kind] = fmt
         test_layout.addWidget(self.test_results)
         
+        test_layout.setEnabled(True)
         layout.addWidget(test_group)
         
         # Button box
-        button_box = QDialogButtonBox(
+        self.button_box = QDialogButtonBox(
             QDialogButtonBox.Ok | QDialogButtonBox.Cancel | QDialogButtonBox.Apply,
             Qt.Horizontal
         )
-        button_box.accepted.connect(self.accept)
-        button_box.rejected.connect(self.reject)
-        button_box.button(QDialogButtonBox.Apply).clicked.connect(self.apply_settings)
-        layout.addWidget(button_box)
+        self.button_box.accepted.connect(self.accept)
+        self.button_box.rejected.connect(self.reject)
+        self.button_box.button(QDialogButtonBox.Apply).clicked.connect(self.apply_settings)
+        layout.addWidget(self.button_box)
+        
+        self.setUpdatesEnabled(True)
         
         # Apply dark theme
         self.apply_theme()
     
     def apply_theme(self):
         """Apply dark theme to dialog"""
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #666666;
-                border-radius: 5px;
-                margin: 5px 0px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #ff6b35;
-            }
-            QLabel {
-                color: #ffffff;
-            }
-            QComboBox {
-                background-color: #4a4a4a;
-                border: 1px solid #666666;
-                padding: 4px;
-                border-radius: 3px;
-                color: #ffffff;
-                min-height: 20px;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 20px;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 4px solid transparent;
-                border-right: 4px solid transparent;
-                border-top: 4px solid #ffffff;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #3c3c3c;
-                border: 1px solid #666666;
-                selection-background-color: #ff6b35;
-                color: #ffffff;
-            }
-            QSpinBox {
-                background-color: #4a4a4a;
-                border: 1px solid #666666;
-                padding: 4px;
-                border-radius: 3px;
-                color: #ffffff;
-                min-height: 20px;
-            }
-            QSpinBox::up-button, QSpinBox::down-button {
-                background-color: #5a5a5a;
-                border: 1px solid #666666;
-                width: 16px;
-            }
-            QSpinBox::up-button:hover, QSpinBox::down-button:hover {
-                background-color: #6a6a6a;
-            }
-            QPushButton {
-                background-color: #4a4a4a;
-                color: #ffffff;
-                border: 1px solid #666666;
-                padding: 6px 16px;
-                border-radius: 3px;
-                min-height: 20px;
-            }
-            QPushButton:hover {
-                background-color: #5a5a5a;
-                border-color: #777777;
-            }
-            QPushButton:pressed {
-                background-color: #ff6b35;
-            }
-            QDialogButtonBox QPushButton {
-                min-width: 80px;
-            }
-        """)
+        self.setStyleSheet(_DARK_QSS)
     
     def refresh_ports(self):
-        """Refresh available MIDI ports"""
-        self.test_results.append("Scanning MIDI ports...")
+        """Refresh available MIDI ports on a worker thread"""
+        # Coalesce repeated clicks into the scan already running
+        if self._scan_inflight:
+            return
+        self._scan_inflight = True
+        
+        self._log("Scanning MIDI ports...")
+        self.refresh_button.setEnabled(False)
+        
+        # Port lists rarely change within seconds; reuse a fresh result
+        if self._ports_cache is not None and time.monotonic() - self._ports_cache_ts < _PORTS_CACHE_TTL:
+            self._on_ports_scanned(self._ports_cache)
+            return
+        
+        self.scan_worker = PortScanWorker(self.midi_manager)
+        self.scan_worker.ports_scanned.connect(self._on_ports_scanned)
+        self.scan_worker.error_occurred.connect(self._on_port_scan_error)
+        self.scan_worker.start()
+    
+    def _on_ports_scanned(self, ports: Dict[str, List[str]]):
+        """Populate the port combos from a completed scan"""
+        if ports is not self._ports_cache:
+            self._ports_cache = ports
+            self._ports_cache_ts = time.monotonic()
         
         try:
-            self.available_ports = self.midi_manager.get_available_ports()
-            
-            # Update input combo
-            current_input = self.input_combo.currentText()
-            self.input_combo.clear()
-            self.input_combo.addItem("-- Select Input Port --", None)
+            inputs = ports['inputs']
+            outputs = ports['outputs']
+            self.available_ports = ports
             
-            for port in self.available_ports['inputs']:
-                self.input_combo.addItem(port, port)
-            
-            # Restore selection if still available
-            input_index = self.input_combo.findText(current_input)
-            if input_index >= 0:
-                self.input_combo.setCurrentIndex(input_index)
-            
-            # Update output combo
-            current_output = self.output_combo.currentText()
-            self.output_combo.clear()
-            self.output_combo.addItem("-- Select Output Port --", None)
+            # Nothing to rebuild if the port lists match what the combos already show
+            port_tuple = (tuple(inputs), tuple(outputs))
+            if port_tuple == self._last_port_tuple:
+                self._log(f"Found {len(inputs)} input ports, {len(outputs)} output ports (unchanged)")
+                return
+            self._last_port_tuple = port_tuple
             
-            for port in self.available_ports['outputs']:
-                self.output_combo.addItem(port, port)
+            self._input_index = self._populate_port_combo(
+                self.input_combo, "-- Select Input Port --", inputs)
+            self._output_index = self._populate_port_combo(
+                self.output_combo, "-- Select Output Port --", outputs)
             
-            # Restore selection if still available
-            output_index = self.output_combo.findText(current_output)
-            if output_index >= 0:
-                self.output_combo.setCurrentIndex(output_index)
+            # Apply saved selections now that the combos are populated
+            if self._pending_input_port is not None or self._pending_output_port is not None:
+                self._restore_port_selections(self._pending_input_port, self._pending_output_port)
+                self._pending_input_port = None
+                self._pending_output_port = None
             
             # Update test results
-            input_count = len(self.available_ports['inputs'])
-            output_count = len(self.available_ports['outputs'])
-            self.test_results.append(f"Found {input_count} input ports, {output_count} output ports")
+            input_count = len(inputs)
+            output_count = len(outputs)
+            self._log(f"Found {input_count} input ports, {output_count} output ports")
             
             if input_count == 0 or output_count == 0:
-                self.test_results.append("WARNING: No MIDI ports found. Check your MIDI setup.")
+                self._log("WARNING: No MIDI ports found. Check your MIDI setup.", kind='warn')
             
         except Exception as e:
-            logger.error(f"Error scanning MIDI ports: {e}")
-            self.test_results.append(f"ERROR: Failed to scan ports - {e}")
-            QMessageBox.warning(self, "MIDI Error", f"Failed to scan MIDI ports:\n{e}")
+            self._on_port_scan_error(str(e))
+        
+        finally:
+            self._scan_inflight = False
+            self.refresh_button.setEnabled(True)
+    
+    def _populate_port_combo(self, combo: QComboBox, placeholder: str,
+                             ports: List[str]) -> Dict[str, int]:
+        """
+        Refill a port combo in one batch, keeping the current selection if still available
+        Returns a port name -> combo index map
+        """
+        current = combo.currentText()
+        index_map = {name: i for i, name in enumerate(ports, 1)}  # Row 0 is the placeholder
+        
+        combo.blockSignals(True)
+        combo.setUpdatesEnabled(False)
+        try:
+            combo.clear()
+            combo.addItem(placeholder)
+            combo.addItems(ports)
+            
+            # Restore selection if still available
+            index = index_map.get(current, -1)
+            if index >= 0:
+                combo.setCurrentIndex(index)
+        finally:
+            combo.blockSignals(False)
+            combo.setUpdatesEnabled(True)
+        
+        return index_map
+    
+    @staticmethod
+    def _selected_port(combo: QComboBox) -> Optional[str]:
+        """Get the port name selected in a combo, or None for the placeholder"""
+        return combo.currentText() if combo.currentIndex() > 0 else None
+    
+    def _on_port_scan_error(self, error: str):
+        """Report a failed port scan"""
+        self._scan_inflight = False
+        self.refresh_button.setEnabled(True)
+        logger.error(f"Error scanning MIDI ports: {error}")
+        self._log(f"ERROR: Failed to scan ports - {error}", kind='err')
+        QMessageBox.warning(self, "MIDI Error", f"Failed to scan MIDI ports:\n{error}")
+    
+    def _log(self, *lines: str, kind: str = 'info'):
+        """Append lines to the test results in a single document update"""
+        cursor = self.test_results.textCursor()
+        cursor.movePosition(QTextCursor.End)
+        if not cursor.atStart():
+            cursor.insertBlock()
+        cursor.insertText("\n".join(lines), self._log_formats[kind])
+        self.test_results.setTextCursor(cursor)
     
     def test_connection(self):
-        """Test MIDI connection with selected ports"""
-        input_port = self.input_combo.currentData()
-        output_port = self.output_combo.currentData()
+        """Test MIDI connection with selected ports on a worker thread"""
+        input_port = self._selected_port(self.input_combo)
+        output_port = self._selected_port(self.output_combo)
         
         if not input_port or not output_port:
             QMessageBox.warning(self, "Invalid Selection", 
                               "Please select both input and output ports.")
             return
         
-        self.test_results.clear()
-        self.test_results.append("Testing MIDI connection...")
-        self.test_results.append(f"Input:  {input_port}")
-        self.test_results.append(f"Output: {output_port}")
-        
-        self.test_button.setEnabled(False)
-        self.connection_status.setText("Testing...")
-        self.connection_status.setStyleSheet("color: #ffaa00;")
+        unit_id = self.unit_id_spin.value()
+        midi_channel = self.midi_channel_spin.value() - 1  # Convert to 0-15
+        query_delay_ms = self.query_delay_spin.value()
+        
+        test_key = (input_port, output_port, unit_id, midi_channel, query_delay_ms)
+        if test_key == self._last_test_key:
+            # Same test as last time: keep the header, drop everything after it
+            self.test_results.setUpdatesEnabled(False)
+            cursor = self.test_results.textCursor()
+            cursor.setPosition(self._test_header_end)
+            cursor.movePosition(QTextCursor.End, QTextCursor.KeepAnchor)
+            cursor.removeSelectedText()
+            self.test_results.setTextCursor(cursor)
+            self.test_results.setUpdatesEnabled(True)
+        else:
+            self.test_results.clear()
+            self._log("Testing MIDI connection...",
+                      f"Input:  {input_port}",
+                      f"Output: {output_port}")
+            self._last_test_key = test_key
+            self._test_header_end = self.test_results.textCursor().position()
+        
+        self._set_test_running(True)
+        self._on_test_status("Testing...", "warn")
+        
+        # Wait at least the manager's response timeout; the delay setting only
+        # spaces queries out, so it only matters here when it is longer
+        query_timeout = max(self.midi_manager.query_timeout, query_delay_ms / 1000.0)
+        
+        self.test_worker = ConnectionTestWorker(
+            self.midi_manager, input_port, output_port,
+            unit_id, midi_channel, query_delay_ms / 1000.0, query_timeout
+        )
+        self.test_worker.lines_logged.connect(lambda lines, kind: self._log(*lines, kind=kind))
+        self.test_worker.status_changed.connect(self._on_test_status)
+        self.test_worker.parameter_queried.connect(self._on_parameter_queried)
+        self.test_worker.connection_failed.connect(self._invalidate_ports_cache)
+        self.test_worker.finished.connect(self._on_test_finished)
+        self.test_worker.start()
+        
+        # Bound the whole test: one communication check plus each sample query
+        query_count = len(_TEST_PARAM_IDS) + 1
+        self._watchdog.start(int(query_count * query_timeout * 1000) + _TEST_WATCHDOG_MARGIN_MS)
+    
+    def _on_test_status(self, text: str, status: str):
+        """Show the connection test status"""
+        self.connection_status.setText(text)
+        
+        # Re-polish so the dialog stylesheet's [status=...] rule applies,
+        # without parsing a per-call stylesheet
+        self.connection_status.setProperty("status", status)
+        style = self.connection_status.style()
+        style.unpolish(self.connection_status)
+        style.polish(self.connection_status)
+    
+    def _on_parameter_queried(self, param_id: int, value):
+        """Show a sample parameter query result"""
+        if isinstance(value, Exception):
+            self._log(f"  Parameter {param_id}: error - {value}", kind='err')
+        elif value is not None:
+            self._log(f"  Parameter {param_id}: {value}")
+        else:
+            self._log(f"  Parameter {param_id}: timeout", kind='warn')
+    
+    def _invalidate_ports_cache(self):
+        """Force the next refresh to enumerate ports again and rebuild the combos"""
+        self._ports_cache = None
+        self._last_port_tuple = None
+    
+    def _abort_test(self):
+        """Give up on a connection test that overran its watchdog"""
+        worker = self.test_worker
+        if not worker or not worker.isRunning():
+            return
         
-        try:
-            # Temporarily update MIDI manager settings
-            old_unit_id = self.midi_manager.unit_id
-            old_channel = self.midi_manager.midi_channel
-            old_delay = self.midi_manager.query_delay
-            
-            self.midi_manager.update_settings(
-                self.unit_id_spin.value(),
-                self.midi_channel_spin.value() - 1  # Convert to 0-15
-            )
-            self.midi_manager.query_delay = self.query_delay_spin.value() / 1000.0
-            
-            # Test connection
-            was_connected = self.midi_manager.is_connected
-            if was_connected:
-                self.midi_manager.disconnect()
-            
-            if self.midi_manager.connect(input_port, output_port):
-                self.test_results.append("✓ MIDI connection established")
-                
-                # Test communication
-                self.test_results.append("Testing communication...")
-                if self.midi_manager.test_connection():
-                    self.test_results.append("✓ Communication test PASSED")
-                    self.connection_status.setText("✓ Connection OK")
-                    self.connection_status.setStyleSheet("color: #00ff00;")
-                    
-                    # Try querying a few parameters
-                    self.test_results.append("Querying sample parameters...")
-                    test_params = [0, 10, 37]  # Unit ID, MIDI Channel, Pitch Bend Range
-                    
-                    for param_id in test_params:
-                        try:
-                            value = self.midi_manager.query_parameter_sync(param_id)
-                            if value is not None:
-                                self.test_results.append(f"  Parameter {param_id}: {value}")
-                            else:
-                                self.test_results.append(f"  Parameter {param_id}: timeout")
-                        except Exception as e:
-                            self.test_results.append(f"  Parameter {param_id}: error - {e}")
-                    
-                else:
-                    self.test_results.append("✗ Communication test FAILED")
-                    self.connection_status.setText("✗ No Response")
-                    self.connection_status.setStyleSheet("color: #ff6666;")
-                    self.test_results.append("Check:")
-                    self.test_results.append("  - Matriarch is powered on")
-                    self.test_results.append("  - MIDI cables connected properly")
-                    self.test_results.append("  - Matriarch MIDI channel settings")
-                
-                # Restore previous connection state
-                self.midi_manager.disconnect()
-                if was_connected:
-                    # Try to reconnect with original settings
-                    self.midi_manager.update_settings(old_unit_id, old_channel)
-                    self.midi_manager.query_delay = old_delay
-                    
-            else:
-                self.test_results.append("✗ Failed to establish MIDI connection")
-                self.connection_status.setText("✗ Connection Failed")
-                self.connection_status.setStyleSheet("color: #ff6666;")
-                self.test_results.append("Check port availability and permissions")
-            
-        except Exception as e:
-            logger.exception("Error during connection test")
-            self.test_results.append(f"✗ Test failed: {e}")
-            self.connection_status.setText("✗ Test Error")
-            self.connection_status.setStyleSheet("color: #ff6666;")
+        # Ignore anything the worker reports while it winds down
+        worker.cancel()
+        worker.lines_logged.disconnect()
+        worker.status_changed.disconnect()
+        worker.parameter_queried.disconnect()
         
-        finally:
-            self.test_button.setEnabled(True)
+        self._log("Test aborted (watchdog)", kind='err')
+        self._on_test_status("✗ Test Timed Out", "err")
+    
+    def _on_test_finished(self):
+        """Re-enable testing once the worker is done"""
+        self._watchdog.stop()
+        self._set_test_running(False)
+    
+    def _set_test_running(self, running: bool):
+        """Lock out Test, OK and Apply while the worker owns the MIDI manager"""
+        self.test_button.setEnabled(not running)
+        self.button_box.button(QDialogButtonBox.Ok).setEnabled(not running)
+        self.button_box.button(QDialogButtonBox.Apply).setEnabled(not running)
+    
+    def _stop_test_worker(self):
+        """Cancel a running connection test and briefly wait for it to restore the connection"""
+        worker = self.test_worker
+        if worker and worker.isRunning():
+            worker.cancel()
+            if not worker.wait(_TEST_CLOSE_WAIT_MS):
+                # Stuck in connect()/send; cancel() can't interrupt that. Let the
+                # dialog close - it outlives the worker, which finishes on its own
+                # and re-enables the buttons through _on_test_finished.
+                logger.warning("Connection test still running after close; finishing in background")
     
     def apply_settings(self):
         """Apply current settings without closing dialog"""
@@ -398,62 +686,88 @@ class MIDISettingsDialog(QDialog):
         )
         self.midi_manager.query_delay = self.query_delay_spin.value() / 1000.0
         
-        self.test_results.append("Settings applied")
+        self._log("Settings applied")
     
     def load_settings(self):
         """Load settings from QSettings"""
-        # MIDI ports
-        input_port = self.settings.value('midi/input_port', '')
-        output_port = self.settings.value('midi/output_port', '')
-        
-        # Set port selections after ports are loaded
-        QTimer.singleShot(100, lambda: self._restore_port_selections(input_port, output_port))
-        
-        # Configuration
-        self.unit_id_spin.setValue(self.settings.value('midi/unit_id', 0, type=int))
-        self.midi_channel_spin.setValue(self.settings.value('midi/midi_channel', 1, type=int))
-        self.query_delay_spin.setValue(self.settings.value('midi/query_delay', 400, type=int))
+        self.settings.beginGroup('midi')
+        try:
+            # MIDI ports
+            input_port = self.settings.value('input_port', '')
+            output_port = self.settings.value('output_port', '')
+            
+            # Port selections are restored when the port scan completes
+            self._pending_input_port = input_port
+            self._pending_output_port = output_port
+            
+            # Configuration
+            self.unit_id_spin.setValue(self.settings.value('unit_id', 0, type=int))
+            self.midi_channel_spin.setValue(self.settings.value('midi_channel', 1, type=int))
+            self.query_delay_spin.setValue(self.settings.value('query_delay', 400, type=int))
+            
+            # Auto-reconnect options
+            self.auto_reconnect_check.setChecked(self.settings.value('auto_reconnect', False, type=bool))
+            self.auto_query_check.setChecked(self.settings.value('auto_query_on_connect', True, type=bool))
+        finally:
+            self.settings.endGroup()
         
-        # Auto-reconnect options
-        self.auto_reconnect_check.setChecked(self.settings.value('midi/auto_reconnect', False, type=bool))
-        self.auto_query_check.setChecked(self.settings.value('midi/auto_query_on_connect', True, type=bool))
+        # Ports aren't selectable until the scan completes, so record the stored ones
+        self._saved_state = self._settings_snapshot()
+        self._saved_state['input_port'] = input_port
+        self._saved_state['output_port'] = output_port
     
     def _restore_port_selections(self, input_port: str, output_port: str):
         """Restore port selections after combo boxes are populated"""
         if input_port:
-            input_index = self.input_combo.findText(input_port)
+            input_index = self._input_index.get(input_port, -1)
             if input_index >= 0:
                 self.input_combo.setCurrentIndex(input_index)
         
         if output_port:
-            output_index = self.output_combo.findText(output_port)
+            output_index = self._output_index.get(output_port, -1)
             if output_index >= 0:
                 self.output_combo.setCurrentIndex(output_index)
     
+    def _settings_snapshot(self) -> Dict[str, object]:
+        """Get the dialog's current values keyed like the 'midi' settings group"""
+        return {
+            'input_port': self._selected_port(self.input_combo),
+            'output_port': self._selected_port(self.output_combo),
+            'unit_id': self.unit_id_spin.value(),
+            'midi_channel': self.midi_channel_spin.value(),
+            'query_delay': self.query_delay_spin.value(),
+            'auto_reconnect': self.auto_reconnect_check.isChecked(),
+            'auto_query_on_connect': self.auto_query_check.isChecked()
+        }
+    
     def save_settings(self):
-        """Save settings to QSettings"""
-        # MIDI ports
-        input_port = self.input_combo.currentData()
-        output_port = self.output_combo.currentData()
+        """Save changed settings to QSettings"""
+        current = self._settings_snapshot()
+        changed = {key: value for key, value in current.items()
+                   if value != self._saved_state.get(key)}
         
-        if input_port:
-            self.settings.setValue('midi/input_port', input_port)
-        if output_port:
-            self.settings.setValue('midi/output_port', output_port)
+        # MIDI ports are only saved once selected
+        for key in ('input_port', 'output_port'):
+            if not current[key]:
+                changed.pop(key, None)
         
-        # Configuration
-        self.settings.setValue('midi/unit_id', self.unit_id_spin.value())
-        self.settings.setValue('midi/midi_channel', self.midi_channel_spin.value())
-        self.settings.setValue('midi/query_delay', self.query_delay_spin.value())
+        if not changed:
+            return
         
-        # Auto-reconnect options
-        self.settings.setValue('midi/auto_reconnect', self.auto_reconnect_check.isChecked())
-        self.settings.setValue('midi/auto_query_on_connect', self.auto_query_check.isChecked())
+        self.settings.beginGroup('midi')
+        try:
+            for key, value in changed.items():
+                self.settings.setValue(key, value)
+        finally:
+            self.settings.endGroup()
+        
+        self.settings.sync()
+        self._saved_state.update(changed)
     
     def accept(self):
         """Handle OK button click"""
-        input_port = self.input_combo.currentData()
-        output_port = self.output_combo.currentData()
+        input_port = self._selected_port(self.input_combo)
+        output_port = self._selected_port(self.output_combo)
         
         if not input_port or not output_port:
             reply = QMessageBox.question(
@@ -468,15 +782,21 @@ class MIDISettingsDialog(QDialog):
         self.save_settings()
         super().accept()
     
+    def done(self, result: int):
+        """Close the dialog (OK, Cancel, Escape or window close)"""
+        # The worker must be finished with midi_manager before the caller reuses it
+        self._stop_test_worker()
+        super().done(result)
+    
     def get_selected_ports(self) -> tuple:
         """Get currently selected ports"""
-        return (self.input_combo.currentData(), self.output_combo.currentData())
+        return (self._selected_port(self.input_combo), self._selected_port(self.output_combo))
     
     def get_midi_settings(self) -> Dict:
         """Get current MIDI settings as dictionary"""
         return {
-            'input_port': self.input_combo.currentData(),
-            'output_port': self.output_combo.currentData(),
+            'input_port': self._selected_port(self.input_combo),
+            'output_port': self._selected_port(self.output_combo),
             'unit_id': self.unit_id_spin.value(),
             'midi_channel': self.midi_channel_spin.value() - 1,  # Convert to 0-15
             'query_delay': self.query_delay_spin.value() / 1000.0  # Convert to seconds
@@ -2,19 +2,92 @@
 Parameter control widgets for different parameter types
 """
 
+import html
 import logging
-from typing import Optional, Dict, Any, List
+import re
+from typing import Optional, Dict, Any, List, Set
 from PyQt5.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QLabel, QPushButton, 
     QSlider, QSpinBox, QComboBox, QCheckBox, QGroupBox, QToolTip
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot, QTimer, QSignalBlocker
 from PyQt5.QtGui import QPalette, QFont
 
-from data.parameter_definitions import Parameter, ParameterType
+from data.parameter_definitions import Parameter, ParameterType, get_parameter_by_id
 
 logger = logging.getLogger(__name__)
 
+SLIDER_EMIT_INTERVAL_MS = 10  # Coalesce slider drags into one emission per interval
+HUMAN_READABLE_CACHE_MAX = 1024  # Precompute display strings for ranges up to this size
+
+# Pre-formatted "(n)" raw value strings for the common 7-bit range
+_RAW = tuple(f"({i})" for i in range(128))
+
+def _raw_text(value: int) -> str:
+    """Raw value in parentheses, e.g. '(64)'"""
+    return _RAW[value] if 0 <= value < 128 else f"({value})"
+
+# Human-readable value in bold orange followed by the small grey raw value
+_VALUE_LABEL_HTML = (
+    "<b><span style='color:#ff6b35'>{}</span></b> "
+    "<span style='color:#888888; font-size:10px'>{}</span>"
+)
+
+def _value_label_html(human_readable: str, value: int) -> str:
+    """Rich text for a slider widget's combined value label"""
+    return _VALUE_LABEL_HTML.format(html.escape(human_readable), _raw_text(value))
+
+# Highlight stylesheets for values that differ from the default. Kept as
+# constants so update_display() never rebuilds them.
+_TOGGLE_HIGHLIGHT_QSS = """
+    QPushButton:checked {
+        background-color: #ff6b35;
+        font-weight: bold;
+    }
+    QPushButton {
+        background-color: #666666;
+        font-weight: bold;
+    }
+"""
+
+_COMBO_HIGHLIGHT_QSS = """
+    QComboBox {
+        background-color: #5a4a2a;
+        border: 2px solid #ff6b35;
+    }
+"""
+
+_SLIDER_HIGHLIGHT_QSS = """
+    QSlider::groove:horizontal {
+        border: 1px solid #ff6b35;
+        background: #4a4a4a;
+        height: 8px;
+    }
+    QSlider::handle:horizontal {
+        background: #ff6b35;
+        border: 1px solid #ff6b35;
+        width: 18px;
+        margin: -5px 0;
+        border-radius: 9px;
+    }
+"""
+
+_SPINBOX_HIGHLIGHT_QSS = """
+    QSpinBox {
+        background-color: #5a4a2a;
+        border: 2px solid #ff6b35;
+    }
+"""
+
+_TRIPLET_HIGHLIGHT_QSS = """
+    QPushButton {
+        background-color: #ff6b35;
+        border: 2px solid #ff6b35;
+        color: #ffffff;
+        font-weight: bold;
+    }
+"""
+
 class ParameterWidget(QWidget):
     """Base class for parameter control widgets"""
     
@@ -26,21 +99,46 @@ class ParameterWidget(QWidget):
         self.current_value = parameter.default_value
         self.is_updating = False  # Prevent signal loops
         self.is_enabled_by_dependency = True
+        self._default_value = parameter.default_value
+        self._was_default = True  # Controls start unhighlighted, i.e. styled as default
+        self._built = False  # Controls are created on first show
+        self._displayed_value = None  # Value last rendered by update_display()
         
-        self.init_ui()
+        self.setToolTip(self._base_tooltip())
         self.update_enabled_state()
     
+    def showEvent(self, event):
+        """Build the controls the first time the widget is shown"""
+        if not self._built:
+            self._built = True
+            # Selecting the initial value must not echo back as a user change
+            self.is_updating = True
+            try:
+                self.init_ui()
+            finally:
+                self.is_updating = False
+        super().showEvent(event)
+    
     def init_ui(self):
         """Initialize the widget UI - override in subclasses"""
         pass
     
     def set_value_silently(self, value: int):
         """Set value without emitting signals"""
+        if value == self._displayed_value:
+            return  # Display already reflects this value
+        
+        self.current_value = value
+        if not self._built:
+            return  # init_ui() will display it on first show
+        
+        # Repaint once for all the control/label/style changes below
         self.is_updating = True
+        self.setUpdatesEnabled(False)
         try:
-            self.current_value = value
             self.update_display()
         finally:
+            self.setUpdatesEnabled(True)
             self.is_updating = False
     
     def update_display(self):
@@ -51,25 +149,45 @@ class ParameterWidget(QWidget):
         """Emit value changed signal if not updating"""
         if not self.is_updating:
             self.current_value = value
+            # The control changed without update_display(); force the next silent set to redraw
+            self._displayed_value = None
             self.value_changed.emit(self.parameter.param_id, value)
     
+    def default_text(self) -> str:
+        """Display text for the default value - override in subclasses"""
+        return str(self._default_value)
+    
+    def _base_tooltip(self) -> str:
+        """Parameter tooltip with the default value appended"""
+        return f"{self.parameter.tooltip}\nDefault: {self.default_text()}"
+    
     def set_dependency_enabled(self, enabled: bool, reason: str = ""):
         """Enable/disable based on parameter dependencies"""
         self.is_enabled_by_dependency = enabled
         self.update_enabled_state()
         
         if not enabled and reason:
-            self.setToolTip(f"{self.parameter.tooltip}\n\nDisabled: {reason}")
+            self.setToolTip(f"{self._base_tooltip()}\n\nDisabled: {reason}")
         else:
-            self.setToolTip(self.parameter.tooltip)
+            self.setToolTip(self._base_tooltip())
     
     def update_enabled_state(self):
         """Update the enabled state of the widget"""
         self.setEnabled(self.is_enabled_by_dependency)
+    
+    def _configure_slider_steps(self):
+        """No tick marks, single-unit steps and a page step of 1/16th of the range"""
+        self.slider.setTickPosition(QSlider.NoTicks)
+        self.slider.setTracking(True)
+        self.slider.setSingleStep(1)
+        self.slider.setPageStep(max(1, (self.slider.maximum() - self.slider.minimum()) // 16))
 
 class ToggleParameterWidget(ParameterWidget):
     """Widget for on/off parameters"""
     
+    def default_text(self) -> str:
+        return "On" if self._default_value else "Off"
+    
     def init_ui(self):
         layout = QHBoxLayout(self)
         layout.setContentsMargins(5, 2, 5, 2)
@@ -86,12 +204,6 @@ class ToggleParameterWidget(ParameterWidget):
         self.toggle_button.clicked.connect(self.on_toggle_clicked)
         layout.addWidget(self.toggle_button)
         
-        # Default indicator
-        default_text = "On" if self.parameter.default_value else "Off"
-        self.default_label = QLabel(f"(Default: {default_text})")
-        self.default_label.setStyleSheet("color: #888888; font-size: 10px;")
-        layout.addWidget(self.default_label)
-        
         layout.addStretch()
         
         # Set initial state
@@ -99,26 +211,18 @@ class ToggleParameterWidget(ParameterWidget):
     
     def update_display(self):
         """Update toggle button display"""
+        self._displayed_value = self.current_value
         is_on = bool(self.current_value)
         self.toggle_button.setChecked(is_on)
         self.toggle_button.setText("On" if is_on else "Off")
         
-        # Highlight if different from default
-        is_default = self.current_value == self.parameter.default_value
-        if not is_default:
-            self.toggle_button.setStyleSheet("""
-                QPushButton:checked {
-                    background-color: #ff6b35;
-                    font-weight: bold;
-                }
-                QPushButton {
-                    background-color: #666666;
-                    font-weight: bold;
-                }
-            """)
-        else:
-            self.toggle_button.setStyleSheet("")
+        # Highlight if different from default (only restyle when it flips)
+        is_default = self.current_value == self._default_value
+        if is_default != self._was_default:
+            self._was_default = is_default
+            self.toggle_button.setStyleSheet("" if is_default else _TOGGLE_HIGHLIGHT_QSS)
     
+    @pyqtSlot(bool)
     def on_toggle_clicked(self, checked: bool):
         """Handle toggle button click"""
         value = 1 if checked else 0
@@ -127,6 +231,9 @@ class ToggleParameterWidget(ParameterWidget):
 class ChoiceParameterWidget(ParameterWidget):
     """Widget for multiple choice parameters"""
     
+    def default_text(self) -> str:
+        return self.parameter.choices.get(self._default_value, "Unknown")
+    
     def init_ui(self):
         layout = QHBoxLayout(self)
         layout.setContentsMargins(5, 2, 5, 2)
@@ -139,10 +246,17 @@ class ChoiceParameterWidget(ParameterWidget):
         # Combo box
         self.combo_box = QComboBox()
         self.combo_box.setMinimumWidth(150)
-        
-        # Populate choices
-        for value, text in self.parameter.choices.items():
+        # Size from a character count instead of measuring every item on show
+        longest = max((len(text) for text in self.parameter.choices.values()), default=0)
+        self.combo_box.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon)
+        self.combo_box.setMinimumContentsLength(max(12, longest))
+        self.combo_box.view().setUniformItemSizes(True)
+        
+        # Populate choices, remembering where each value lives
+        self._value_to_index: Dict[int, int] = {}
+        for index, (value, text) in enumerate(self.parameter.choices.items()):
             self.combo_box.addItem(text, value)
+            self._value_to_index[value] = index
         
         self.combo_box.currentIndexChanged.connect(self.on_combo_changed)
         layout.addWidget(self.combo_box)
@@ -152,12 +266,6 @@ class ChoiceParameterWidget(ParameterWidget):
         self.raw_value_label.setStyleSheet("color: #888888; font-size: 10px;")
         layout.addWidget(self.raw_value_label)
         
-        # Default indicator
-        default_text = self.parameter.choices.get(self.parameter.default_value, "Unknown")
-        self.default_label = QLabel(f"(Default: {default_text})")
-        self.default_label.setStyleSheet("color: #888888; font-size: 10px;")
-        layout.addWidget(self.default_label)
-        
         layout.addStretch()
         
         # Set initial state
@@ -165,27 +273,22 @@ class ChoiceParameterWidget(ParameterWidget):
     
     def update_display(self):
         """Update combo box selection"""
-        # Find the item with matching value
-        for i in range(self.combo_box.count()):
-            if self.combo_box.itemData(i) == self.current_value:
-                self.combo_box.setCurrentIndex(i)
-                break
+        self._displayed_value = self.current_value
+        # Select the item with matching value
+        index = self._value_to_index.get(self.current_value, -1)
+        if index >= 0:
+            self.combo_box.setCurrentIndex(index)
         
         # Update raw value display
-        self.raw_value_label.setText(f"({self.current_value})")
-        
-        # Highlight if different from default
-        is_default = self.current_value == self.parameter.default_value
-        if not is_default:
-            self.combo_box.setStyleSheet("""
-                QComboBox {
-                    background-color: #5a4a2a;
-                    border: 2px solid #ff6b35;
-                }
-            """)
-        else:
-            self.combo_box.setStyleSheet("")
+        self.raw_value_label.setText(_raw_text(self.current_value))
+        
+        # Highlight if different from default (only restyle when it flips)
+        is_default = self.current_value == self._default_value
+        if is_default != self._was_default:
+            self._was_default = is_default
+            self.combo_box.setStyleSheet("" if is_default else _COMBO_HIGHLIGHT_QSS)
     
+    @pyqtSlot(int)
     def on_combo_changed(self, index: int):
         """Handle combo box selection change"""
         if index >= 0:
@@ -196,7 +299,19 @@ class ChoiceParameterWidget(ParameterWidget):
 class RangeParameterWidget(ParameterWidget):
     """Widget for range parameters with slider and spinbox"""
     
+    def default_text(self) -> str:
+        return f"{self.parameter.get_human_readable(self._default_value)} ({self._default_value})"
+    
     def init_ui(self):
+        # Human-readable strings for every value in range, so drags don't reformat
+        lo = self.parameter.min_value or 0
+        hi = self.parameter.max_value or 127
+        self._hr_base = lo
+        if hi - lo < HUMAN_READABLE_CACHE_MAX:
+            self._hr_cache = [self.parameter.get_human_readable(v) for v in range(lo, hi + 1)]
+        else:
+            self._hr_cache = []
+        
         layout = QVBoxLayout(self)
         layout.setContentsMargins(5, 2, 5, 2)
         
@@ -209,16 +324,11 @@ class RangeParameterWidget(ParameterWidget):
         
         top_layout.addStretch()
         
-        # Current value display
+        # Current value display, human-readable followed by the raw value
         self.value_label = QLabel()
-        self.value_label.setStyleSheet("font-weight: bold; color: #ff6b35;")
+        self.value_label.setTextFormat(Qt.RichText)
         top_layout.addWidget(self.value_label)
         
-        # Raw value in parentheses
-        self.raw_value_label = QLabel()
-        self.raw_value_label.setStyleSheet("color: #888888; font-size: 10px;")
-        top_layout.addWidget(self.raw_value_label)
-        
         layout.addLayout(top_layout)
         
         # Bottom row: slider and spinbox
@@ -228,9 +338,18 @@ class RangeParameterWidget(ParameterWidget):
         self.slider = QSlider(Qt.Horizontal)
         self.slider.setMinimum(self.parameter.min_value or 0)
         self.slider.setMaximum(self.parameter.max_value or 127)
+        self._configure_slider_steps()
         self.slider.valueChanged.connect(self.on_slider_changed)
+        self.slider.sliderReleased.connect(self._flush_emit)
         bottom_layout.addWidget(self.slider, stretch=3)
         
+        # Only the latest slider value is emitted once the drag settles
+        self._pending_value: Optional[int] = None
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(SLIDER_EMIT_INTERVAL_MS)
+        self._emit_timer.timeout.connect(self._flush_emit)
+        
         # Spinbox for precise control
         self.spinbox = QSpinBox()
         self.spinbox.setMinimum(self.parameter.min_value or 0)
@@ -241,86 +360,82 @@ class RangeParameterWidget(ParameterWidget):
         
         layout.addLayout(bottom_layout)
         
-        # Default value indicator
-        default_readable = self.parameter.get_human_readable(self.parameter.default_value)
-        self.default_label = QLabel(f"Default: {default_readable} ({self.parameter.default_value})")
-        self.default_label.setStyleSheet("color: #888888; font-size: 10px;")
-        layout.addWidget(self.default_label)
-        
         # Set initial state
         self.update_display()
     
     def update_display(self):
         """Update slider and spinbox values"""
+        self._displayed_value = self.current_value
         # Update controls without triggering signals
-        self.slider.blockSignals(True)
-        self.spinbox.blockSignals(True)
-        
-        self.slider.setValue(self.current_value)
-        self.spinbox.setValue(self.current_value)
-        
-        self.slider.blockSignals(False)
-        self.spinbox.blockSignals(False)
+        with QSignalBlocker(self.slider), QSignalBlocker(self.spinbox):
+            self.slider.setValue(self.current_value)
+            self.spinbox.setValue(self.current_value)
         
         # Update value displays
-        human_readable = self.parameter.get_human_readable(self.current_value)
-        self.value_label.setText(human_readable)
-        self.raw_value_label.setText(f"({self.current_value})")
-        
-        # Highlight if different from default
-        is_default = self.current_value == self.parameter.default_value
-        if not is_default:
-            self.slider.setStyleSheet("""
-                QSlider::groove:horizontal {
-                    border: 1px solid #ff6b35;
-                    background: #4a4a4a;
-                    height: 8px;
-                }
-                QSlider::handle:horizontal {
-                    background: #ff6b35;
-                    border: 1px solid #ff6b35;
-                    width: 18px;
-                    margin: -5px 0;
-                    border-radius: 9px;
-                }
-            """)
-            self.spinbox.setStyleSheet("""
-                QSpinBox {
-                    background-color: #5a4a2a;
-                    border: 2px solid #ff6b35;
-                }
-            """)
-        else:
-            self.slider.setStyleSheet("")
-            self.spinbox.setStyleSheet("")
+        self.value_label.setText(_value_label_html(self._human_readable(self.current_value), self.current_value))
+        
+        # Highlight if different from default (only restyle when it flips)
+        is_default = self.current_value == self._default_value
+        if is_default != self._was_default:
+            self._was_default = is_default
+            self.slider.setStyleSheet("" if is_default else _SLIDER_HIGHLIGHT_QSS)
+            self.spinbox.setStyleSheet("" if is_default else _SPINBOX_HIGHLIGHT_QSS)
     
+    @pyqtSlot(int)
     def on_slider_changed(self, value: int):
         """Handle slider value change"""
+        if value == self.current_value:
+            return
+        
         # Update spinbox to match
-        self.spinbox.blockSignals(True)
-        self.spinbox.setValue(value)
-        self.spinbox.blockSignals(False)
+        with QSignalBlocker(self.spinbox):
+            self.spinbox.setValue(value)
         
-        # Update display and emit signal
-        self.emit_value_changed(value)
+        # Track the value now, emit it once the drag settles
+        self.current_value = value
+        self._displayed_value = None  # Slider moved without update_display()
+        self._pending_value = value
+        self._emit_timer.start()
         
         # Update display immediately for responsiveness
-        human_readable = self.parameter.get_human_readable(value)
-        self.value_label.setText(human_readable)
-        self.raw_value_label.setText(f"({value})")
-    
+        self.value_label.setText(_value_label_html(self._human_readable(value), value))
+    
+    def _human_readable(self, value: int) -> str:
+        """Cached human-readable text for value, formatted on demand if out of cache"""
+        index = value - self._hr_base
+        if 0 <= index < len(self._hr_cache):
+            return self._hr_cache[index]
+        return self.parameter.get_human_readable(value)
+    
+    @pyqtSlot()
+    def _flush_emit(self):
+        """Emit the latest pending slider value, if any"""
+        self._emit_timer.stop()
+        if self._pending_value is not None:
+            value, self._pending_value = self._pending_value, None
+            self.emit_value_changed(value)
+    
+    @pyqtSlot(int)
     def on_spinbox_changed(self, value: int):
         """Handle spinbox value change"""
+        if value == self.current_value:
+            return
+        
         # Update slider to match
-        self.slider.blockSignals(True)
-        self.slider.setValue(value)
-        self.slider.blockSignals(False)
+        with QSignalBlocker(self.slider):
+            self.slider.setValue(value)
         
+        # Supersedes any slider value still waiting to be emitted
+        self._emit_timer.stop()
+        self._pending_value = None
         self.emit_value_changed(value)
 
 class MIDIChannelParameterWidget(ParameterWidget):
     """Special widget for MIDI channel parameters (1-16 display, 0-15 internal)"""
     
+    def default_text(self) -> str:
+        return f"Channel {self._default_value + 1}"
+    
     def init_ui(self):
         layout = QHBoxLayout(self)
         layout.setContentsMargins(5, 2, 5, 2)
@@ -333,6 +448,10 @@ class MIDIChannelParameterWidget(ParameterWidget):
         # Channel selector
         self.channel_combo = QComboBox()
         self.channel_combo.setMinimumWidth(100)
+        # Size from a character count instead of measuring every item on show
+        self.channel_combo.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon)
+        self.channel_combo.setMinimumContentsLength(len("Channel 16"))
+        self.channel_combo.view().setUniformItemSizes(True)
         
         # Add channels 1-16 (stored as 0-15)
         for i in range(16):
@@ -346,12 +465,6 @@ class MIDIChannelParameterWidget(ParameterWidget):
         self.raw_value_label.setStyleSheet("color: #888888; font-size: 10px;")
         layout.addWidget(self.raw_value_label)
         
-        # Default indicator
-        default_display = f"Channel {self.parameter.default_value + 1}"
-        self.default_label = QLabel(f"(Default: {default_display})")
-        self.default_label.setStyleSheet("color: #888888; font-size: 10px;")
-        layout.addWidget(self.default_label)
-        
         layout.addStretch()
         
         # Set initial state
@@ -359,25 +472,22 @@ class MIDIChannelParameterWidget(ParameterWidget):
     
     def update_display(self):
         """Update combo box selection"""
+        self._displayed_value = self.current_value
         # Set combo box to current value
-        self.channel_combo.setCurrentIndex(self.current_value)
+        with QSignalBlocker(self.channel_combo):
+            self.channel_combo.setCurrentIndex(self.current_value)
         
         # Update raw value display
-        self.raw_value_label.setText(f"({self.current_value})")
-        
-        # Highlight if different from default
-        is_default = self.current_value == self.parameter.default_value
-        if not is_default:
-            self.channel_combo.setStyleSheet("""
-                QComboBox {
-                    background-color: #5a4a2a;
-                    border: 2px solid #ff6b35;
-                }
-            """)
-        else:
-            self.channel_combo.setStyleSheet("")
+        self.raw_value_label.setText(_raw_text(self.current_value))
+        
+        # Highlight if different from default (only restyle when it flips)
+        is_default = self.current_value == self._default_value
+        if is_default != self._was_default:
+            self._was_default = is_default
+            self.channel_combo.setStyleSheet("" if is_default else _COMBO_HIGHLIGHT_QSS)
     
-    def on_channel_changed(self, index):
+    @pyqtSlot(int)
+    def on_channel_changed(self, index: int):
         """Handle MIDI channel selection change"""
         if index >= 0:
             value = self.channel_combo.itemData(index)
@@ -387,7 +497,12 @@ class MIDIChannelParameterWidget(ParameterWidget):
 class SwingParameterWidget(ParameterWidget):
     """Special widget for swing parameter with triplet button"""
     
+    def default_text(self) -> str:
+        return f"{self.parameter.get_human_readable(self._default_value)} ({self._default_value})"
+    
     def init_ui(self):
+        self._triplet_style_key = None
+        
         layout = QVBoxLayout(self)
         layout.setContentsMargins(5, 2, 5, 2)
         
@@ -400,16 +515,11 @@ class SwingParameterWidget(ParameterWidget):
         
         top_layout.addStretch()
         
-        # Current value display
+        # Current value display, human-readable followed by the raw value
         self.value_label = QLabel()
-        self.value_label.setStyleSheet("font-weight: bold; color: #ff6b35;")
+        self.value_label.setTextFormat(Qt.RichText)
         top_layout.addWidget(self.value_label)
         
-        # Raw value in parentheses
-        self.raw_value_label = QLabel()
-        self.raw_value_label.setStyleSheet("color: #888888; font-size: 10px;")
-        top_layout.addWidget(self.raw_value_label)
-        
         layout.addLayout(top_layout)
         
         # Middle row: slider and spinbox
@@ -419,6 +529,7 @@ class SwingParameterWidget(ParameterWidget):
         self.slider = QSlider(Qt.Horizontal)
         self.slider.setMinimum(self.parameter.min_value or 0)
         self.slider.setMaximum(self.parameter.max_value or 16383)
+        self._configure_slider_steps()
         self.slider.valueChanged.connect(self.on_slider_changed)
         middle_layout.addWidget(self.slider, stretch=3)
         
@@ -445,15 +556,10 @@ class SwingParameterWidget(ParameterWidget):
         triplet_layout.addStretch()
         layout.addLayout(triplet_layout)
         
-        # Default value indicator
-        default_readable = self.parameter.get_human_readable(self.parameter.default_value)
-        self.default_label = QLabel(f"Default: {default_readable} ({self.parameter.default_value})")
-        self.default_label.setStyleSheet("color: #888888; font-size: 10px;")
-        layout.addWidget(self.default_label)
-        
         # Set initial state
         self.update_display()
     
+    @pyqtSlot()
     def set_triplet_swing(self):
         """Set swing to 66% (triplet feel)"""
         # Calculate the raw value for 66%
@@ -472,124 +578,88 @@ class SwingParameterWidget(ParameterWidget):
     
     def update_display(self):
         """Update slider and spinbox values"""
+        self._displayed_value = self.current_value
         # Update controls without triggering signals
-        self.slider.blockSignals(True)
-        self.spinbox.blockSignals(True)
-    
-        self.slider.setValue(self.current_value)
-        self.spinbox.setValue(self.current_value)
-    
-        self.slider.blockSignals(False)
-        self.spinbox.blockSignals(False)
+        with QSignalBlocker(self.slider), QSignalBlocker(self.spinbox):
+            self.slider.setValue(self.current_value)
+            self.spinbox.setValue(self.current_value)
     
         # Update value displays
         human_readable = self.parameter.get_human_readable(self.current_value)
-        self.value_label.setText(human_readable)
-        self.raw_value_label.setText(f"({self.current_value})")
+        self.value_label.setText(_value_label_html(human_readable, self.current_value))
     
         # Check if we're at triplet value (66%) and highlight button accordingly
         current_percent = 22 + (self.current_value / 16383.0) * (78 - 22)
         is_triplet = abs(current_percent - 66) < 1  # Within 1% of 66%
     
         # Highlight slider/spinbox if different from default
-        is_default = self.current_value == self.parameter.default_value
-        if not is_default:
-            self.slider.setStyleSheet("""
-                QSlider::groove:horizontal {
-                    border: 1px solid #ff6b35;
-                    background: #4a4a4a;
-                    height: 8px;
-                }
-                QSlider::handle:horizontal {
-                    background: #ff6b35;
-                    border: 1px solid #ff6b35;
-                    width: 18px;
-                    margin: -5px 0;
-                    border-radius: 9px;
-                }
-            """)
-            self.spinbox.setStyleSheet("""
-                QSpinBox {
-                    background-color: #5a4a2a;
-                    border: 2px solid #ff6b35;
-                }
-            """)
-        else:
-            self.slider.setStyleSheet("")
-            self.spinbox.setStyleSheet("")
+        is_default = self.current_value == self._default_value
+        if is_default != self._was_default:
+            self._was_default = is_default
+            self.slider.setStyleSheet("" if is_default else _SLIDER_HIGHLIGHT_QSS)
+            self.spinbox.setStyleSheet("" if is_default else _SPINBOX_HIGHLIGHT_QSS)
     
         # Highlight triplet button if at 66%
-        if is_triplet:
-            self.triplet_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #ff6b35;
-                    border: 2px solid #ff6b35;
-                    color: #ffffff;
-                    font-weight: bold;
-                }
-            """)
-        else:
-            self.triplet_button.setStyleSheet("")
+        self._set_triplet_highlight(is_triplet)
     
+    @pyqtSlot(int)
     def on_slider_changed(self, value: int):
         """Handle slider value change"""
         # Update spinbox to match
-        self.spinbox.blockSignals(True)
-        self.spinbox.setValue(value)
-        self.spinbox.blockSignals(False)
+        with QSignalBlocker(self.spinbox):
+            self.spinbox.setValue(value)
     
         # Update display and emit signal
         self.emit_value_changed(value)
     
         # Update display immediately for responsiveness
         human_readable = self.parameter.get_human_readable(value)
-        self.value_label.setText(human_readable)
-        self.raw_value_label.setText(f"({value})")
+        self.value_label.setText(_value_label_html(human_readable, value))
     
         # Update triplet button highlighting - turn off if not at 66%
         current_percent = 22 + (value / 16383.0) * (78 - 22)
-        if abs(current_percent - 66) < 1:
-            self.triplet_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #ff6b35;
-                    border: 2px solid #ff6b35;
-                    color: #ffffff;
-                    font-weight: bold;
-                }
-            """)
-        else:
-            self.triplet_button.setStyleSheet("")
+        self._set_triplet_highlight(abs(current_percent - 66) < 1)
     
+    def _set_triplet_highlight(self, is_triplet: bool):
+        """Restyle the triplet button only when its highlight state flips"""
+        if is_triplet != self._triplet_style_key:
+            self._triplet_style_key = is_triplet
+            self.triplet_button.setStyleSheet(_TRIPLET_HIGHLIGHT_QSS if is_triplet else "")
+    
+    @pyqtSlot(int)
     def on_spinbox_changed(self, value: int):
         """Handle spinbox value change"""
         # Update slider to match
-        self.slider.blockSignals(True)
-        self.slider.setValue(value)
-        self.slider.blockSignals(False)
+        with QSignalBlocker(self.slider):
+            self.slider.setValue(value)
         
         self.emit_value_changed(value)
     
 
+SWING_PARAM_ID = 23  # ARP/SEQ Swing gets its own widget with a triplet button
+
+_WIDGET_CTORS = {
+    ParameterType.TOGGLE: ToggleParameterWidget,
+    ParameterType.CHOICE: ChoiceParameterWidget,
+    ParameterType.RANGE: RangeParameterWidget,
+    ParameterType.MIDI_CHANNEL: MIDIChannelParameterWidget,
+}
+
+def create_parameter_widget(parameter: Parameter) -> ParameterWidget:
+    """Create appropriate widget for parameter type"""
+    if parameter.param_id == SWING_PARAM_ID:
+        return SwingParameterWidget(parameter)
+    
+    ctor = _WIDGET_CTORS.get(parameter.param_type)
+    if ctor is None:
+        logger.warning(f"Unknown parameter type: {parameter.param_type}")
+        ctor = ToggleParameterWidget  # Fallback
+    return ctor(parameter)
+
 class ParameterWidgetFactory:
     """Factory for creating appropriate parameter widgets"""
     
-    @staticmethod
-    def create_widget(parameter: Parameter) -> ParameterWidget:
-        """Create appropriate widget for parameter type"""
-        # Special case for ARP/SEQ Swing parameter
-        if parameter.param_id == 23:  # ARP/SEQ Swing
-            return SwingParameterWidget(parameter)
-        elif parameter.param_type == ParameterType.TOGGLE:
-            return ToggleParameterWidget(parameter)
-        elif parameter.param_type == ParameterType.CHOICE:
-            return ChoiceParameterWidget(parameter)
-        elif parameter.param_type == ParameterType.RANGE:
-            return RangeParameterWidget(parameter)
-        elif parameter.param_type == ParameterType.MIDI_CHANNEL:
-            return MIDIChannelParameterWidget(parameter)
-        else:
-            logger.warning(f"Unknown parameter type: {parameter.param_type}")
-            return ToggleParameterWidget(parameter)  # Fallback
+    create_widget = staticmethod(create_parameter_widget)
 
 class DependencyManager:
     """Manages parameter dependencies and enables/disables widgets accordingly"""
@@ -597,21 +667,64 @@ class DependencyManager:
     def __init__(self, widgets: Dict[int, ParameterWidget]):
         self.widgets = widgets
         self.current_values = {}
+        
+        # Parameters that have dependencies, looked up once
+        self._param_cache: Dict[int, Parameter] = {}
+        # Source param_id -> params whose dependencies mention it
+        self._dependents: Dict[int, Set[int]] = {}
+        # Params with a dependency we can't attribute; rechecked on every change
+        self._unindexed: Set[int] = set()
+        
+        # Rechecks are deferred to the event loop so a burst of updates
+        # (e.g. a full parameter query) is handled in one pass
+        self._dirty: Set[int] = set()
+        self._recheck_timer = QTimer()
+        self._recheck_timer.setSingleShot(True)
+        self._recheck_timer.setInterval(0)
+        self._recheck_timer.timeout.connect(self._recheck_dirty)
+        
+        for param_id in widgets:
+            param = get_parameter_by_id(param_id)
+            if not (param and param.dependencies):
+                continue
+            self._param_cache[param_id] = param
+            for dependency in param.dependencies:
+                source_id = self._dependency_source(dependency)
+                if source_id is None:
+                    self._unindexed.add(param_id)
+                else:
+                    self._dependents.setdefault(source_id, set()).add(param_id)
+    
+    @staticmethod
+    def _dependency_source(dependency: str) -> Optional[int]:
+        """param_id a dependency string refers to (its leading number), if any"""
+        match = re.match(r'\s*(\d+)', str(dependency))
+        return int(match.group(1)) if match else None
     
     def update_value(self, param_id: int, value: int):
-        """Update value and check dependencies"""
+        """Update value and schedule a recheck of the parameters that depend on it"""
         self.current_values[param_id] = value
-        self._check_all_dependencies()
+        
+        affected = self._dependents.get(param_id, set()) | self._unindexed
+        if affected:
+            self._dirty |= affected
+            self._recheck_timer.start()
+    
+    def _recheck_dirty(self):
+        """Recheck every parameter touched since the last pass"""
+        dirty, self._dirty = self._dirty, set()
+        for dependent_id in dirty:
+            self._recheck(dependent_id)
+    
+    def _recheck(self, param_id: int):
+        """Re-evaluate one parameter's dependencies and update its widget"""
+        enabled, reason = self._check_dependencies(self._param_cache[param_id])
+        self.widgets[param_id].set_dependency_enabled(enabled, reason)
     
     def _check_all_dependencies(self):
         """Check all parameter dependencies and update widget states"""
-        from data.parameter_definitions import get_parameter_by_id
-        
-        for param_id, widget in self.widgets.items():
-            param = get_parameter_by_id(param_id)
-            if param and param.dependencies:
-                enabled, reason = self._check_dependencies(param)
-                widget.set_dependency_enabled(enabled, reason)
+        for param_id in self._param_cache:
+            self._recheck(param_id)
     
     def _check_dependencies(self, parameter: Parameter) -> tuple[bool, str]:
         """Check if parameter dependencies are satisfied"""
@@ -630,8 +743,7 @@ class DependencyManager:
 
 # Helper functions for creating parameter groups
 
-def create_parameter_group(title: str, parameters: List[Parameter], 
-                          factory: ParameterWidgetFactory) -> QGroupBox:
+def create_parameter_group(title: str, parameters: List[Parameter]) -> QGroupBox:
     """Create a group box containing parameter widgets"""
     group = QGroupBox(title)
     layout = QVBoxLayout(group)
@@ -639,7 +751,7 @@ def create_parameter_group(title: str, parameters: List[Parameter],
     
     widgets = []
     for param in parameters:
-        widget = factory.create_widget(param)
+        widget = create_parameter_widget(param)
         layout.addWidget(widget)
         widgets.append(widget)
     
@@ -667,12 +779,15 @@ class ParameterGroupWidget(QWidget):
         layout.addWidget(title_label)
         
         # Add parameter widgets
-        factory = ParameterWidgetFactory()
-        for param in self.parameters:
-            widget = factory.create_widget(param)
-            widget.value_changed.connect(self.value_changed.emit)
-            self.widgets[param.param_id] = widget
-            layout.addWidget(widget)
+        self.setUpdatesEnabled(False)
+        try:
+            for param in self.parameters:
+                widget = create_parameter_widget(param)
+                widget.value_changed.connect(self.value_changed)  # Re-emitted by Qt directly
+                self.widgets[param.param_id] = widget
+                layout.addWidget(widget)
+        finally:
+            self.setUpdatesEnabled(True)
     
     def set_value_silently(self, param_id: int, value: int):
         """Set value for a specific parameter without emitting signals"""